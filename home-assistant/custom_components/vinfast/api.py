@@ -1,11 +1,14 @@
 """VinFast Connected Car API Client."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+from time import monotonic
 from typing import Any
 
 import aiohttp
-import async_timeout
+import orjson
 
 from .const import (
     AUTH0_DOMAIN,
@@ -16,9 +19,43 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Transient failures (5xx / connection errors) are retried with full-jitter
+# exponential backoff. Auth and invalid-request errors are never retried.
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF_BASE = 0.5
+_RETRY_BACKOFF_CAP = 8.0
+
+# Per-request timeout, and end-to-end budget for a full get_all_data refresh
+_REQUEST_TIMEOUT = 30.0
+_REFRESH_DEADLINE = 60.0
+
+# Seconds to wait before asking for alias mappings again after an empty or failed fetch
+_ALIAS_NEGATIVE_TTL = 300.0
+
+# Auth0 token request headers and pre-serialized constant body fields
+# (the serialized object minus its closing brace)
+_AUTH_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+_AUTH_PAYLOAD_PREFIX = orjson.dumps({
+    "client_id": AUTH0_CLIENT_ID,
+    "audience": AUTH0_AUDIENCE,
+    "grant_type": "password",
+    "scope": "offline_access openid profile email",
+})[:-1]
+_REFRESH_PAYLOAD_PREFIX = orjson.dumps({
+    "client_id": AUTH0_CLIENT_ID,
+    "grant_type": "refresh_token",
+})[:-1]
+
+# Response "code" values that indicate success
+_OK_CODES = frozenset((0, 200000))
+
 # Known aliases we want to request from the API
 # These match the actual VinFast API alias names from the APK (VehicleDeviceKeyAlias.java)
-TELEMETRY_ALIASES = [
+TELEMETRY_ALIASES: tuple[str, ...] = (
     # Battery & Charging
     "VEHICLE_STATUS_HV_BATTERY_SOC",          # Battery state of charge (%)
     "VEHICLE_STATUS_REMAINING_DISTANCE",      # Estimated range (km)
@@ -56,7 +93,50 @@ TELEMETRY_ALIASES = [
     "LOCATION_LATITUDE",                      # GPS latitude (Double)
     "LOCATION_LONGITUDE",                     # GPS longitude (Double)
     "VEHICLE_BEARING_DEGREE",                 # Heading direction (Double)
-]
+)
+
+# Map aliases to friendly telemetry keys
+_ALIAS_TO_KEY: dict[str, str] = {
+    # Battery & Charging
+    "VEHICLE_STATUS_HV_BATTERY_SOC": "battery_level",
+    "VEHICLE_STATUS_REMAINING_DISTANCE": "range",
+    "VEHICLE_STATUS_ODOMETER": "odometer",
+    "CHARGING_STATUS_CHARGING_STATUS": "charging_status",
+    "CHARGING_STATUS_CHARGING_REMAINING_TIME": "time_to_full",
+    "CHARGE_CONTROL_CURRENT_TARGET_SOC": "charge_limit",
+    "CHARGE_CONTROL_SAMPLE_CHARGE_STATUS": "sample_charge_status",
+    # Vehicle Status
+    "VEHICLE_STATUS_IGNITION_STATUS": "ignition",
+    "VEHICLE_STATUS_GEAR_POSITION": "gear",
+    "VEHICLE_STATUS_VEHICLE_SPEED": "speed",
+    "VEHICLE_STATUS_HANDBRAKE_STATUS": "handbrake",
+    # Climate
+    "VEHICLE_STATUS_AMBIENT_TEMPERATURE": "outside_temp",
+    "CLIMATE_INFORMATION_DRIVER_TEMPERATURE": "inside_temp",
+    "CLIMATE_INFORMATION_STATUS": "climate_status",
+    # Tire Pressure
+    "VEHICLE_STATUS_FRONT_LEFT_TIRE_PRESSURE": "tire_pressure_fl",
+    "VEHICLE_STATUS_FRONT_RIGHT_TIRE_PRESSURE": "tire_pressure_fr",
+    "VEHICLE_STATUS_REAR_LEFT_TIRE_PRESSURE": "tire_pressure_rl",
+    "VEHICLE_STATUS_REAR_RIGHT_TIRE_PRESSURE": "tire_pressure_rr",
+    # Door Status
+    "DOOR_AJAR_FRONT_LEFT_DOOR_STATUS": "door_fl",
+    "DOOR_AJAR_FRONT_RIGHT_DOOR_STATUS": "door_fr",
+    "DOOR_AJAR_REAR_LEFT_DOOR_STATUS": "door_rl",
+    "DOOR_AJAR_REAR_RIGHT_DOOR_STATUS": "door_rr",
+    "DOOR_TRUNK_DOOR_STATUS": "trunk_status",
+    # Remote Control Status
+    "REMOTE_CONTROL_DOOR_STATUS": "locked",
+    "REMOTE_CONTROL_BONNET_CONTROL_STATUS": "hood_status",
+    "REMOTE_CONTROL_WINDOW_STATUS": "window_status",
+    "REMOTE_CONTROL_CHARGE_PORT_STATUS": "plugged_in",
+    # Location
+    "LOCATION_LATITUDE": "latitude",
+    "LOCATION_LONGITUDE": "longitude",
+    "VEHICLE_BEARING_DEGREE": "heading",
+}
+
+_TELEMETRY_ALIAS_SET: frozenset[str] = frozenset(TELEMETRY_ALIASES)
 
 # Fallback static resource paths (used if get-alias fails)
 # These paths are based on LwM2M Object IDs observed in the VinFast app
@@ -91,6 +171,92 @@ FALLBACK_TELEMETRY_RESOURCES = [
     "/34210/0/0",
 ]
 
+# Fallback paths parsed once into ping request objects
+_FALLBACK_REQUEST_OBJECTS: tuple[dict[str, str], ...] = tuple(
+    {"objectId": parts[0], "instanceId": parts[1], "resourceId": parts[2]}
+    for parts in (path.strip("/").split("/") for path in FALLBACK_TELEMETRY_RESOURCES)
+    if len(parts) == 3
+)
+
+
+def _request_timeout(deadline: float | None) -> asyncio.Timeout:
+    """Return a timeout context for one request, capped by an optional deadline."""
+    if deadline is None:
+        return asyncio.timeout(_REQUEST_TIMEOUT)
+    return asyncio.timeout(max(0.0, min(_REQUEST_TIMEOUT, deadline - monotonic())))
+
+
+def _deadline_passed(deadline: float | None) -> bool:
+    """Return True if an optional monotonic deadline has been reached."""
+    return deadline is not None and deadline - monotonic() <= 0
+
+
+def _parse_alias_response(data: Any) -> dict[str, dict[str, str]]:
+    """Parse a get-alias response body into alias -> resource mapping."""
+    # Parse the response - handle different possible formats:
+    # [...], {"data": {"resources": [...]}}, {"data": [...]}, {"resources": [...]}
+    if isinstance(data, list):
+        resources = data
+    elif isinstance(data, dict):
+        inner = data.get("data")
+        if isinstance(inner, dict):
+            resources = inner.get("resources") or []
+        elif isinstance(inner, list):
+            resources = inner
+        else:
+            resources = data.get("resources") or []
+    else:
+        resources = []
+    _LOGGER.debug("get-alias response: %d resources", len(resources))
+
+    mappings = {}
+    for resource in resources:
+        if not isinstance(resource, dict):
+            continue
+        alias = resource.get("alias")
+        if alias:
+            obj_id, inst_id, rsrc_id = (
+                resource.get("devObjID", ""),
+                resource.get("devObjInstID", "0"),
+                resource.get("devRsrcID", "0"),
+            )
+
+            # Build the resource path: /{objectId}/{instanceId}/{resourceId}
+            path = f"/{obj_id}/{inst_id}/{rsrc_id}"
+
+            mappings[alias] = {
+                "path": path,
+                "objectId": obj_id,
+                "instanceId": inst_id,
+                "resourceId": rsrc_id,
+                "name": resource.get("name", ""),
+                "units": resource.get("units", ""),
+                "type": resource.get("type", ""),
+            }
+    return mappings
+
+
+def _path_from_device_key(device_key: str) -> str:
+    """Convert a ping deviceKey (34183_00001_00003) to a resource path (/34183/1/3)."""
+    parts = device_key.split("_")
+    if len(parts) != 3:
+        return device_key
+    # Remove leading zeros without an int round-trip
+    return "/".join((
+        "",
+        parts[0].lstrip("0") or "0",
+        parts[1].lstrip("0") or "0",
+        parts[2].lstrip("0") or "0",
+    ))
+
+
+def _coerce_value(value: Any) -> Any:
+    """Return value as a float when it is numeric, otherwise unchanged."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
 
 class VinFastApiError(Exception):
     """Exception for VinFast API errors."""
@@ -100,11 +266,62 @@ class VinFastAuthError(VinFastApiError):
     """Exception for authentication errors."""
 
 
+class _RetryAfterRefresh(Exception):
+    """Raised when the access token was refreshed and the request should be retried."""
+
+
+class _CircuitBreaker:
+    """Minimal CLOSED -> OPEN -> HALF_OPEN circuit breaker.
+
+    After failure_threshold consecutive failures the breaker opens and
+    requests are short-circuited for recovery_timeout seconds. Then a
+    single probe is let through; its outcome closes or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0) -> None:
+        """Initialize the breaker in the closed state."""
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self.failure_count = 0
+        self.opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be attempted now."""
+        if self.state == "closed":
+            return True
+        if monotonic() - self.opened_at < self.recovery_timeout:
+            return False
+        # Let exactly one probe through per recovery window
+        self.state = "half_open"
+        self.opened_at = monotonic()
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful call and close the breaker."""
+        self.state = "closed"
+        self.failure_count = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if needed."""
+        self.failure_count += 1
+        if self.state == "half_open" or self.failure_count >= self.failure_threshold:
+            if self.state != "open":
+                _LOGGER.warning("Circuit opened after %d failures", self.failure_count)
+            self.state = "open"
+            self.opened_at = monotonic()
+
+
 class VinFastApi:
     """VinFast Connected Car API Client."""
 
     def __init__(self, session: aiohttp.ClientSession) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        The session is Home Assistant's shared client session (from
+        ``async_get_clientsession``) and is owned by Home Assistant, so it
+        is borrowed here and never closed by this client.
+        """
         self._session = session
         self._access_token: str | None = None
         self._refresh_token: str | None = None
@@ -112,6 +329,27 @@ class VinFastApi:
         self._vin: str | None = None
         self._alias_mappings: dict[str, dict[str, str]] = {}  # alias -> {path, objectId, etc}
         self._alias_version: str | None = None
+        self._alias_fetched_at: float | None = None  # monotonic time of last empty get-alias answer
+        self._ping_request_objects: list[dict[str, str]] = []  # ping body for requested aliases
+        self._path_to_alias: dict[str, str] = {}  # path -> alias, for requested aliases only
+        self._device_key_to_alias: dict[str, str] = {}  # ping deviceKey -> alias
+        self._base_headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "x-service-name": "CAPP",
+            "x-app-version": "1.10.3",
+            "x-device-platform": "HomeAssistant",
+            "x-device-family": "Integration",
+            "x-device-os-version": "1.0",
+            "x-device-locale": "en-US",
+            "x-timezone": "America/New_York",
+            "x-device-identifier": "ha-vinfast-integration",
+        }
+        self._headers_cache: dict[str, str] | None = None
+        self._auth_breaker = _CircuitBreaker()  # Auth0 token endpoint
+        self._api_breaker = _CircuitBreaker()  # API_BASE endpoints
+        # Serializes token refreshes so concurrent 401s reuse one refresh
+        self._refresh_lock = asyncio.Lock()
 
     @property
     def vin(self) -> str | None:
@@ -127,29 +365,34 @@ class VinFastApi:
         """Authenticate with VinFast Connected Car services."""
         url = f"https://{AUTH0_DOMAIN}/oauth/token"
 
-        payload = {
-            "client_id": AUTH0_CLIENT_ID,
-            "audience": AUTH0_AUDIENCE,
-            "grant_type": "password",
-            "scope": "offline_access openid profile email",
-            "username": email,
-            "password": password,
-        }
+        # Constant fields are pre-serialized; only the credentials are encoded here
+        payload = (
+            _AUTH_PAYLOAD_PREFIX
+            + b',"username":' + orjson.dumps(email)
+            + b',"password":' + orjson.dumps(password)
+            + b"}"
+        )
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        if not self._auth_breaker.allow_request():
+            raise VinFastApiError("Auth circuit open")
 
         try:
-            async with async_timeout.timeout(30):
+            async with asyncio.timeout(_REQUEST_TIMEOUT):
                 async with self._session.post(
-                    url, json=payload, headers=headers
+                    url, data=payload, headers=_AUTH_HEADERS
                 ) as response:
+                    if response.status >= 500:
+                        self._auth_breaker.record_failure()
+                    else:
+                        self._auth_breaker.record_success()
                     if response.status == 200:
-                        data = await response.json()
+                        try:
+                            data = orjson.loads(await response.read())
+                        except orjson.JSONDecodeError as err:
+                            raise VinFastApiError(f"Invalid auth response: {err}") from err
                         self._access_token = data["access_token"]
                         self._refresh_token = data.get("refresh_token")
+                        self._invalidate_headers()
                         _LOGGER.debug("Authentication successful")
                         return True
                     elif response.status == 401:
@@ -159,107 +402,209 @@ class VinFastApi:
                         _LOGGER.error("Auth failed: %s - %s", response.status, text)
                         raise VinFastApiError(f"Authentication failed: {response.status}")
         except aiohttp.ClientError as err:
+            self._auth_breaker.record_failure()
             _LOGGER.error("Connection error during auth: %s", err)
             raise VinFastApiError(f"Connection error: {err}") from err
+        except asyncio.TimeoutError:
+            self._auth_breaker.record_failure()
+            raise
+
+    async def refresh_auth(self, stale_token: str | None = None) -> bool:
+        """Refresh the access token.
+
+        stale_token is the access token a failed request was sent with. If
+        another caller has already replaced it, no refresh is made and the
+        caller can simply retry. Auth0 may revoke rotated refresh tokens
+        that are used twice, so refreshes never run concurrently.
+        """
+        async with self._refresh_lock:
+            if stale_token is not None and self._access_token != stale_token:
+                return True
+            return await self._refresh_auth_locked()
 
-    async def refresh_auth(self) -> bool:
-        """Refresh the access token."""
+    async def _refresh_auth_locked(self) -> bool:
+        """Exchange the refresh token for a new access token."""
         if not self._refresh_token:
             return False
 
         url = f"https://{AUTH0_DOMAIN}/oauth/token"
 
-        payload = {
-            "client_id": AUTH0_CLIENT_ID,
-            "grant_type": "refresh_token",
-            "refresh_token": self._refresh_token,
-        }
+        payload = (
+            _REFRESH_PAYLOAD_PREFIX
+            + b',"refresh_token":' + orjson.dumps(self._refresh_token)
+            + b"}"
+        )
+
+        if not self._auth_breaker.allow_request():
+            _LOGGER.debug("Auth circuit open, skipping token refresh")
+            return False
 
         try:
-            async with async_timeout.timeout(30):
-                async with self._session.post(url, json=payload) as response:
+            async with asyncio.timeout(_REQUEST_TIMEOUT):
+                async with self._session.post(
+                    url, data=payload, headers=_AUTH_HEADERS
+                ) as response:
+                    if response.status >= 500:
+                        self._auth_breaker.record_failure()
+                    else:
+                        self._auth_breaker.record_success()
                     if response.status == 200:
-                        data = await response.json()
+                        data = orjson.loads(await response.read())
                         self._access_token = data["access_token"]
                         self._refresh_token = data.get("refresh_token", self._refresh_token)
+                        self._invalidate_headers()
                         return True
                     return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            self._auth_breaker.record_failure()
+            _LOGGER.error("Token refresh failed: %s", err)
+            return False
         except Exception as err:
             _LOGGER.error("Token refresh failed: %s", err)
             return False
 
+    def _invalidate_headers(self) -> None:
+        """Drop cached headers after the token, VIN or user ID changes."""
+        self._headers_cache = None
+
     def _get_headers(self) -> dict[str, str]:
-        """Build headers for API requests."""
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "x-service-name": "CAPP",
-            "x-app-version": "1.10.3",
-            "x-device-platform": "HomeAssistant",
-            "x-device-family": "Integration",
-            "x-device-os-version": "1.0",
-            "x-device-locale": "en-US",
-            "x-timezone": "America/New_York",
-            "x-device-identifier": "ha-vinfast-integration",
-        }
-        if self._vin:
-            headers["x-vin-code"] = self._vin
-        if self._user_id:
-            headers["x-player-identifier"] = self._user_id
-        return headers
+        """Return headers for API requests.
+
+        The dict is cached and shared across requests; it is only rebuilt
+        after _invalidate_headers() is called.
+        """
+        if self._headers_cache is None:
+            headers = {
+                "Authorization": f"Bearer {self._access_token}",
+                **self._base_headers,
+            }
+            if self._vin:
+                headers["x-vin-code"] = self._vin
+            if self._user_id:
+                headers["x-player-identifier"] = self._user_id
+            self._headers_cache = headers
+        return self._headers_cache
 
     async def _api_request(
-        self, method: str, endpoint: str, data: dict | None = None
+        self,
+        method: str,
+        endpoint: str,
+        data: Any = None,
+        deadline: float | None = None,
     ) -> dict[str, Any]:
-        """Make an API request."""
-        url = f"{API_BASE}{endpoint}"
+        """Make an API request.
 
-        try:
-            async with async_timeout.timeout(30):
-                if method == "GET":
-                    async with self._session.get(
-                        url, headers=self._get_headers()
-                    ) as response:
-                        return await self._handle_response(response)
-                elif method == "POST":
-                    async with self._session.post(
-                        url, headers=self._get_headers(), json=data
+        If deadline (a monotonic timestamp) is given, every attempt including
+        retries must finish before it.
+        """
+        url = f"{API_BASE}{endpoint}"
+        body = orjson.dumps(data) if data is not None else None
+        refreshed = False
+        attempt = 0
+        last_error: Exception | None = None
+
+        if not self._api_breaker.allow_request():
+            raise VinFastApiError("API circuit open")
+
+        while True:
+            if last_error is not None and _deadline_passed(deadline):
+                # Budget ran out during backoff; don't start a doomed attempt
+                self._api_breaker.record_failure()
+                raise last_error
+            last_attempt = attempt + 1 >= _RETRY_ATTEMPTS
+            # Token the request is sent with, so a 401 can tell if it's stale
+            token = self._access_token
+            try:
+                async with _request_timeout(deadline):
+                    async with self._session.request(
+                        method, url, headers=self._get_headers(), data=body
                     ) as response:
-                        return await self._handle_response(response)
-        except aiohttp.ClientError as err:
-            _LOGGER.error("API request failed: %s", err)
-            raise VinFastApiError(f"API request failed: {err}") from err
-
-    async def _handle_response(self, response: aiohttp.ClientResponse) -> dict[str, Any]:
-        """Handle API response."""
-        if response.status == 401:
-            if await self.refresh_auth():
-                raise VinFastApiError("Token refreshed, retry request")
-            raise VinFastAuthError("Authentication expired")
-
-        if response.status != 200:
-            text = await response.text()
-            raise VinFastApiError(f"API error {response.status}: {text}")
+                        status = response.status
+                        give_up = (
+                            last_attempt
+                            or status not in _RETRY_STATUSES
+                            or _deadline_passed(deadline)
+                        )
+                        if status < 500:
+                            self._api_breaker.record_success()
+                        elif give_up:
+                            self._api_breaker.record_failure()
+                        if give_up:
+                            return await self._handle_response(response, token)
+                        _LOGGER.debug("API request %s returned %s, retrying", endpoint, status)
+                        last_error = VinFastApiError(f"API error {status}")
+            except _RetryAfterRefresh:
+                # At most one retry, after a 401 triggered a successful token refresh
+                if refreshed:
+                    raise VinFastAuthError("Authentication expired") from None
+                refreshed = True
+                continue
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                if last_attempt or _deadline_passed(deadline):
+                    self._api_breaker.record_failure()
+                    if isinstance(err, asyncio.TimeoutError):
+                        raise
+                    _LOGGER.error("API request failed: %s", err)
+                    raise VinFastApiError(f"API request failed: {err}") from err
+                _LOGGER.debug("API request %s failed (%s), retrying", endpoint, err)
+                if isinstance(err, asyncio.TimeoutError):
+                    last_error = err
+                else:
+                    last_error = VinFastApiError(f"API request failed: {err}")
+                    last_error.__cause__ = err
+            except aiohttp.ClientError as err:
+                _LOGGER.error("API request failed: %s", err)
+                raise VinFastApiError(f"API request failed: {err}") from err
+
+            delay = random.uniform(0, min(_RETRY_BACKOFF_CAP, _RETRY_BACKOFF_BASE * 2**attempt))
+            if deadline is not None:
+                # Never sleep past the deadline
+                delay = min(delay, max(0.0, deadline - monotonic()))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _handle_response(
+        self, response: aiohttp.ClientResponse, token: str | None = None
+    ) -> dict[str, Any]:
+        """Handle API response.
 
-        data = await response.json()
-        if data.get("code") not in (0, 200000):
-            raise VinFastApiError(f"API error: {data.get('message', 'Unknown error')}")
+        token is the access token the request was sent with.
+        """
+        status = response.status
+        if status == 200:
+            try:
+                data = orjson.loads(await response.read())
+            except orjson.JSONDecodeError as err:
+                raise VinFastApiError(f"Invalid API response: {err}") from err
+            if data.get("code") not in _OK_CODES:
+                raise VinFastApiError(f"API error: {data.get('message', 'Unknown error')}")
+            return data
+
+        if status == 401:
+            if await self.refresh_auth(token):
+                raise _RetryAfterRefresh
+            raise VinFastAuthError("Authentication expired")
 
-        return data
+        text = await response.text()
+        raise VinFastApiError(f"API error {status}: {text}")
 
-    async def get_vehicles(self) -> list[dict[str, Any]]:
+    async def get_vehicles(self, deadline: float | None = None) -> list[dict[str, Any]]:
         """Get list of vehicles for the account."""
-        data = await self._api_request("GET", "/ccarusermgnt/api/v1/user-vehicle")
+        data = await self._api_request(
+            "GET", "/ccarusermgnt/api/v1/user-vehicle", deadline=deadline
+        )
         vehicles = data.get("data", [])
 
         if vehicles:
             self._vin = vehicles[0].get("vinCode")
             self._user_id = vehicles[0].get("userId")
+            self._invalidate_headers()
 
         return vehicles
 
-    async def get_alias_mappings(self, version: str = "1.0") -> dict[str, dict[str, str]]:
+    async def get_alias_mappings(
+        self, version: str = "1.0", deadline: float | None = None
+    ) -> dict[str, dict[str, str]]:
         """Fetch alias-to-resource-path mappings from the server.
 
         This retrieves the dynamic mapping between human-readable aliases
@@ -268,115 +613,109 @@ class VinFastApi:
         if self._alias_mappings and self._alias_version == version:
             return self._alias_mappings
 
+        # Negative cache: don't hit the endpoint every poll while it returns nothing
+        if (
+            not self._alias_mappings
+            and self._alias_fetched_at is not None
+            and monotonic() - self._alias_fetched_at < _ALIAS_NEGATIVE_TTL
+        ):
+            return {}
+
         try:
             # This endpoint may have different response format, so we call it directly
             url = f"{API_BASE}/modelmgmt/api/v2/vehicle-model/mobile-app/vehicle/get-alias?version={version}"
 
-            async with async_timeout.timeout(30):
+            async with _request_timeout(deadline):
                 async with self._session.get(url, headers=self._get_headers()) as response:
                     if response.status != 200:
                         _LOGGER.warning("get-alias returned status %s", response.status)
+                        # Auth failures clear up once the token is refreshed,
+                        # so only negative-cache other statuses
+                        if response.status not in (401, 403):
+                            self._alias_fetched_at = monotonic()
                         return {}
 
-                    data = await response.json()
-                    _LOGGER.debug("get-alias response: %s", data)
-
-            # Parse the response - handle different possible formats
-            resources = []
-            if isinstance(data, dict):
-                # Try: {"data": {"resources": [...]}}
-                resources = data.get("data", {}).get("resources", [])
-                # Try: {"data": [...]}
-                if not resources and isinstance(data.get("data"), list):
-                    resources = data.get("data", [])
-                # Try: {"resources": [...]}
-                if not resources:
-                    resources = data.get("resources", [])
-            elif isinstance(data, list):
-                resources = data
-
-            mappings = {}
-            for resource in resources:
-                alias = resource.get("alias")
-                if alias:
-                    obj_id = resource.get("devObjID", "")
-                    inst_id = resource.get("devObjInstID", "0")
-                    rsrc_id = resource.get("devRsrcID", "0")
-
-                    # Build the resource path: /{objectId}/{instanceId}/{resourceId}
-                    path = f"/{obj_id}/{inst_id}/{rsrc_id}"
-
-                    mappings[alias] = {
-                        "path": path,
-                        "objectId": obj_id,
-                        "instanceId": inst_id,
-                        "resourceId": rsrc_id,
-                        "name": resource.get("name", ""),
-                        "units": resource.get("units", ""),
-                        "type": resource.get("type", ""),
-                    }
-
-            if mappings:
-                self._alias_mappings = mappings
-                self._alias_version = version
-                _LOGGER.debug("Loaded %d alias mappings from server", len(mappings))
-
-                # Log which of our requested aliases were found
-                found = [a for a in TELEMETRY_ALIASES if a in mappings]
-                missing = [a for a in TELEMETRY_ALIASES if a not in mappings]
-                _LOGGER.debug("Aliases found: %d, missing: %d", len(found), len(missing))
-
-            return mappings
-
-        except (aiohttp.ClientError, Exception) as err:
+                    data = orjson.loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as err:
             _LOGGER.warning("Failed to fetch alias mappings: %s", err)
             return {}
 
-    async def get_profile(self) -> dict[str, Any]:
+        mappings = _parse_alias_response(data)
+
+        if not mappings:
+            # The server answered but has no aliases; don't ask again every poll
+            self._alias_fetched_at = monotonic()
+        else:
+            self._alias_mappings = mappings
+            self._alias_version = version
+            # Precompute the ping request body and its reverse lookups once
+            # per alias version instead of on every telemetry poll
+            self._ping_request_objects = []
+            self._path_to_alias = {}
+            self._device_key_to_alias = {}
+            for alias in TELEMETRY_ALIASES:
+                mapping = mappings.get(alias)
+                if mapping is None:
+                    continue
+                self._ping_request_objects.append({
+                    "objectId": mapping["objectId"],
+                    "instanceId": mapping["instanceId"],
+                    "resourceId": mapping["resourceId"],
+                })
+                self._path_to_alias[mapping["path"]] = alias
+                # Ping responses identify values as {objectId}_{instanceId:05d}_{resourceId:05d}
+                try:
+                    device_key = (
+                        f"{mapping['objectId']}_"
+                        f"{int(mapping['instanceId']):05d}_{int(mapping['resourceId']):05d}"
+                    )
+                except (ValueError, TypeError):
+                    continue
+                self._device_key_to_alias[device_key] = alias
+            _LOGGER.debug("Loaded %d alias mappings from server", len(mappings))
+
+            # Log how many of our requested aliases were found
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                found = sum(1 for alias in mappings if alias in _TELEMETRY_ALIAS_SET)
+                _LOGGER.debug(
+                    "Aliases found: %d, missing: %d", found, len(TELEMETRY_ALIASES) - found
+                )
+
+        return mappings
+
+    async def get_profile(self, deadline: float | None = None) -> dict[str, Any]:
         """Get user profile."""
         data = await self._api_request(
-            "GET", "/ccarusermgnt/api/v1/auth0/account/profile"
+            "GET", "/ccarusermgnt/api/v1/auth0/account/profile", deadline=deadline
         )
         return data.get("data", {})
 
-    async def get_telemetry(self) -> dict[str, Any] | None:
+    async def get_telemetry(self, deadline: float | None = None) -> dict[str, Any] | None:
         """Get vehicle telemetry data."""
         if not self._vin:
             _LOGGER.info("TELEMETRY: No VIN available, skipping telemetry fetch")
             return None
 
         # Try to fetch alias mappings first (for dynamic resource paths)
-        alias_mappings = await self.get_alias_mappings()
+        alias_mappings = await self.get_alias_mappings(deadline=deadline)
         _LOGGER.debug("Telemetry: alias_mappings returned %d mappings", len(alias_mappings) if alias_mappings else 0)
 
         # Build request objects from alias mappings
         # API expects: [{"instanceId": "1", "objectId": "34183", "resourceId": "3"}, ...]
-        request_objects = []
-        path_to_alias = {}  # Reverse mapping for parsing response
+        request_objects: list[dict[str, str]] | tuple[dict[str, str], ...] = []
+        # Reverse mappings for parsing response
+        path_to_alias: dict[str, str] = {}
+        device_key_to_alias: dict[str, str] = {}
 
         if alias_mappings:
-            # Use dynamic paths from server
-            for alias in TELEMETRY_ALIASES:
-                if alias in alias_mappings:
-                    mapping = alias_mappings[alias]
-                    path = mapping["path"]
-                    request_objects.append({
-                        "objectId": mapping["objectId"],
-                        "instanceId": mapping["instanceId"],
-                        "resourceId": mapping["resourceId"],
-                    })
-                    path_to_alias[path] = alias
+            # Use dynamic paths from server (built once when mappings were loaded)
+            request_objects = self._ping_request_objects
+            path_to_alias = self._path_to_alias
+            device_key_to_alias = self._device_key_to_alias
             _LOGGER.debug("Telemetry: Using %d dynamic resources from alias mappings", len(request_objects))
         else:
-            # Fallback to static paths - parse them into object format
-            for path in FALLBACK_TELEMETRY_RESOURCES:
-                parts = path.strip("/").split("/")
-                if len(parts) == 3:
-                    request_objects.append({
-                        "objectId": parts[0],
-                        "instanceId": parts[1],
-                        "resourceId": parts[2],
-                    })
+            # Fallback to static paths (parsed once at import)
+            request_objects = _FALLBACK_REQUEST_OBJECTS
             _LOGGER.debug("Telemetry: Using %d fallback static resources", len(request_objects))
 
         if not request_objects:
@@ -392,22 +731,29 @@ class VinFastApi:
                 "POST",
                 "/ccaraccessmgmt/api/v1/telemetry/app/ping",
                 request_objects,  # Send array directly, not wrapped in object
+                deadline=deadline,
             )
             raw_data = data.get("data")
             if not raw_data:
                 _LOGGER.debug("Telemetry: No data in response")
                 return None
+            if not isinstance(raw_data, list):
+                _LOGGER.debug("Telemetry: ping response is not a list: %s", type(raw_data))
+                return None
 
-            _LOGGER.debug("Telemetry: Received %d values", len(raw_data) if isinstance(raw_data, list) else 0)
+            _LOGGER.debug("Telemetry: Received %d values", len(raw_data))
 
             # Parse ping response - it's a list of VehiclePingResourceDto objects
-            return self._parse_ping_response(raw_data, path_to_alias)
+            return self._parse_ping_response(raw_data, path_to_alias, device_key_to_alias)
         except VinFastApiError as err:
             _LOGGER.debug("Telemetry request failed: %s", err)
             return None
 
     def _parse_ping_response(
-        self, raw_data: list, path_to_alias: dict[str, str] | None = None
+        self,
+        raw_data: list[Any],
+        path_to_alias: dict[str, str] | None = None,
+        device_key_to_alias: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Parse ping response into friendly format.
 
@@ -422,93 +768,39 @@ class VinFastApi:
         }
 
         deviceKey format is: {objectId}_{instanceId:05d}_{resourceId:05d}
+
+        The caller guarantees raw_data is a list.
         """
-        result = {}
-
-        if not isinstance(raw_data, list):
-            _LOGGER.debug("Telemetry: ping response is not a list: %s", type(raw_data))
-            return result
-
-        # Map aliases to friendly keys (same as in _parse_telemetry)
-        alias_to_key = {
-            # Battery & Charging
-            "VEHICLE_STATUS_HV_BATTERY_SOC": "battery_level",
-            "VEHICLE_STATUS_REMAINING_DISTANCE": "range",
-            "VEHICLE_STATUS_ODOMETER": "odometer",
-            "CHARGING_STATUS_CHARGING_STATUS": "charging_status",
-            "CHARGING_STATUS_CHARGING_REMAINING_TIME": "time_to_full",
-            "CHARGE_CONTROL_CURRENT_TARGET_SOC": "charge_limit",
-            "CHARGE_CONTROL_SAMPLE_CHARGE_STATUS": "sample_charge_status",
-            # Vehicle Status
-            "VEHICLE_STATUS_IGNITION_STATUS": "ignition",
-            "VEHICLE_STATUS_GEAR_POSITION": "gear",
-            "VEHICLE_STATUS_VEHICLE_SPEED": "speed",
-            "VEHICLE_STATUS_HANDBRAKE_STATUS": "handbrake",
-            # Climate
-            "VEHICLE_STATUS_AMBIENT_TEMPERATURE": "outside_temp",
-            "CLIMATE_INFORMATION_DRIVER_TEMPERATURE": "inside_temp",
-            "CLIMATE_INFORMATION_STATUS": "climate_status",
-            # Tire Pressure
-            "VEHICLE_STATUS_FRONT_LEFT_TIRE_PRESSURE": "tire_pressure_fl",
-            "VEHICLE_STATUS_FRONT_RIGHT_TIRE_PRESSURE": "tire_pressure_fr",
-            "VEHICLE_STATUS_REAR_LEFT_TIRE_PRESSURE": "tire_pressure_rl",
-            "VEHICLE_STATUS_REAR_RIGHT_TIRE_PRESSURE": "tire_pressure_rr",
-            # Door Status
-            "DOOR_AJAR_FRONT_LEFT_DOOR_STATUS": "door_fl",
-            "DOOR_AJAR_FRONT_RIGHT_DOOR_STATUS": "door_fr",
-            "DOOR_AJAR_REAR_LEFT_DOOR_STATUS": "door_rl",
-            "DOOR_AJAR_REAR_RIGHT_DOOR_STATUS": "door_rr",
-            "DOOR_TRUNK_DOOR_STATUS": "trunk_status",
-            # Remote Control Status
-            "REMOTE_CONTROL_DOOR_STATUS": "locked",
-            "REMOTE_CONTROL_BONNET_CONTROL_STATUS": "hood_status",
-            "REMOTE_CONTROL_WINDOW_STATUS": "window_status",
-            "REMOTE_CONTROL_CHARGE_PORT_STATUS": "plugged_in",
-            # Location
-            "LOCATION_LATITUDE": "latitude",
-            "LOCATION_LONGITUDE": "longitude",
-            "VEHICLE_BEARING_DEGREE": "heading",
-        }
+        result: dict[str, Any] = {}
+        device_key_to_alias = device_key_to_alias or {}
+        path_to_alias = path_to_alias or {}
 
         for item in raw_data:
             if not isinstance(item, dict):
                 continue
-
             device_key = item.get("deviceKey")
             value = item.get("value")
+            if not device_key or value is None:
+                continue
 
-            if device_key and value is not None:
-
-                # Parse deviceKey format: 34183_00001_00003 -> /34183/1/3
-                parts = device_key.split("_")
-                if len(parts) == 3:
-                    obj_id = str(int(parts[0]))  # Remove leading zeros
-                    inst_id = str(int(parts[1]))  # Remove leading zeros
-                    rsrc_id = str(int(parts[2]))  # Remove leading zeros
-                    path = f"/{obj_id}/{inst_id}/{rsrc_id}"
-                else:
-                    path = device_key
-
-                # Use path_to_alias to get alias, then alias_to_key for friendly name
-                friendly_key = path  # Default to path if not mapped
-                if path_to_alias and path in path_to_alias:
-                    alias = path_to_alias[path]
-                    friendly_key = alias_to_key.get(alias, alias.lower())
-
-                # Try to convert to float for numeric values
-                try:
-                    result[friendly_key] = float(value)
-                except (ValueError, TypeError):
-                    result[friendly_key] = value
+            # Fast path: deviceKey was precomputed from the requested resources
+            alias = device_key_to_alias.get(device_key)
+            if alias is None:
+                path = _path_from_device_key(device_key)
+                alias = path_to_alias.get(path)
+                if alias is None:
+                    result[path] = _coerce_value(value)  # Default to path if not mapped
+                    continue
+            result[_ALIAS_TO_KEY.get(alias, alias.lower())] = _coerce_value(value)
 
         _LOGGER.debug("Telemetry: Parsed %d values", len(result))
         return result
 
-    async def get_locations(self) -> list[dict[str, Any]]:
+    async def get_locations(self, deadline: float | None = None) -> list[dict[str, Any]]:
         """Get saved locations."""
         try:
             data = await self._api_request(
-                "GET", "/ccarusermgnt/api/v1/location-favorite"
+                "GET", "/ccarusermgnt/api/v1/location-favorite", deadline=deadline
             )
             return data.get("data", [])
         except VinFastApiError:
@@ -522,25 +814,39 @@ class VinFastApi:
             "telemetry": None,
             "locations": [],
         }
+        # One end-to-end budget so retries can't stack past the update interval
+        deadline = monotonic() + _REFRESH_DEADLINE
 
         try:
-            result["vehicles"] = await self.get_vehicles()
+            result["vehicles"] = await self.get_vehicles(deadline)
         except VinFastApiError as err:
             _LOGGER.warning("Failed to get vehicles: %s", err)
 
-        try:
-            result["profile"] = await self.get_profile()
-        except VinFastApiError as err:
-            _LOGGER.warning("Failed to get profile: %s", err)
+        # Telemetry needs the VIN from get_vehicles; the rest are independent
+        profile, telemetry, locations = await asyncio.gather(
+            self.get_profile(deadline),
+            self.get_telemetry(deadline),
+            self.get_locations(deadline),
+            return_exceptions=True,
+        )
 
-        try:
-            result["telemetry"] = await self.get_telemetry()
-        except VinFastApiError as err:
-            _LOGGER.debug("Telemetry unavailable: %s", err)
+        for value in (profile, telemetry, locations):
+            if isinstance(value, BaseException) and not isinstance(value, VinFastApiError):
+                raise value
 
-        try:
-            result["locations"] = await self.get_locations()
-        except VinFastApiError as err:
-            _LOGGER.debug("Locations unavailable: %s", err)
+        if isinstance(profile, VinFastApiError):
+            _LOGGER.warning("Failed to get profile: %s", profile)
+        else:
+            result["profile"] = profile
+
+        if isinstance(telemetry, VinFastApiError):
+            _LOGGER.debug("Telemetry unavailable: %s", telemetry)
+        else:
+            result["telemetry"] = telemetry
+
+        if isinstance(locations, VinFastApiError):
+            _LOGGER.debug("Locations unavailable: %s", locations)
+        else:
+            result["locations"] = locations
 
         return result
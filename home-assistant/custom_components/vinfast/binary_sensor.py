@@ -20,141 +20,76 @@ from .const import DOMAIN
 from .coordinator import VinFastDataUpdateCoordinator
 
 
-@dataclass(frozen=True)
+# Telemetry keys of the individual door sensors
+_DOOR_KEYS = ("door_fl", "door_fr", "door_rl", "door_rr")
+
+
+@dataclass(frozen=True, slots=True)
 class VinFastBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes VinFast binary sensor entity."""
 
+    # Receives the coordinator's telemetry dict
     value_fn: Callable[[dict[str, Any]], bool | None] = lambda x: None
 
 
-def get_telemetry_value(data: dict[str, Any], key: str) -> Any:
-    """Get a value from telemetry data."""
-    telemetry = data.get("telemetry")
-    if telemetry and isinstance(telemetry, dict):
-        return telemetry.get(key)
-    return None
-
-
-def is_locked(data: dict[str, Any]) -> bool | None:
-    """Check if vehicle is unlocked for BinarySensorDeviceClass.LOCK.
+def _make_eq(
+    key: str, target: int = 1, invert: bool = False
+) -> Callable[[dict[str, Any]], bool | None]:
+    """Build a check that an integer telemetry value equals target (or differs, if invert).
 
-    VinFast API: 0=unlocked, 1=locked (from DoorsInfo.java)
-    Home Assistant LOCK device class: is_on=True means UNLOCKED
-
-    So we return True when value == 0 (unlocked), False when value == 1 (locked).
+    The invert choice is made once here, so the returned function has no
+    per-call branching on it.
     """
-    value = get_telemetry_value(data, "locked")
-    if value is not None:
-        try:
-            # Return True if unlocked (value==0), False if locked (value==1)
-            return int(value) == 0
-        except (ValueError, TypeError):
-            return None
-    return None
-
-
-def is_ignition_on(data: dict[str, Any]) -> bool | None:
-    """Check if ignition is on (0=off, 1=on)."""
-    value = get_telemetry_value(data, "ignition")
-    if value is not None:
-        try:
-            return int(value) == 1
-        except (ValueError, TypeError):
-            return None
-    return None
-
-
-def is_charging(data: dict[str, Any]) -> bool | None:
-    """Check if vehicle is charging (1=charging)."""
-    value = get_telemetry_value(data, "charging_status")
-    if value is not None:
-        try:
-            return int(value) == 1
-        except (ValueError, TypeError):
-            return None
-    return None
+    if invert:
+        def _check(telemetry: dict[str, Any]) -> bool | None:
+            value = telemetry.get(key)
+            if value is None:
+                return None
+            try:
+                return int(value) != target
+            except (ValueError, TypeError):
+                return None
+    else:
+        def _check(telemetry: dict[str, Any]) -> bool | None:
+            value = telemetry.get(key)
+            if value is None:
+                return None
+            try:
+                return int(value) == target
+            except (ValueError, TypeError):
+                return None
+    return _check
 
 
-def is_plugged_in(data: dict[str, Any]) -> bool | None:
+def is_plugged_in(telemetry: dict[str, Any]) -> bool | None:
     """Check if charger is plugged in."""
     # Try the dedicated charge port status first
-    value = get_telemetry_value(data, "plugged_in")
-    if value is not None:
-        try:
-            return int(value) == 1
-        except (ValueError, TypeError):
-            pass
-    # Fallback: plugged in if charging status is not 0
-    value = get_telemetry_value(data, "charging_status")
-    if value is not None:
-        try:
-            return int(value) > 0
-        except (ValueError, TypeError):
+    value = telemetry.get("plugged_in")
+    if value is None:
+        # Fallback: plugged in if charging status is not 0
+        value = telemetry.get("charging_status")
+        if value is None:
             return None
-    return None
-
-
-def is_trunk_open(data: dict[str, Any]) -> bool | None:
-    """Check if trunk is open (0=closed, 1=open)."""
-    value = get_telemetry_value(data, "trunk_status")
-    if value is not None:
-        try:
-            return int(value) == 1
-        except (ValueError, TypeError):
-            return None
-    return None
-
-
-def is_hood_open(data: dict[str, Any]) -> bool | None:
-    """Check if hood is open (0=closed, 1=open)."""
-    value = get_telemetry_value(data, "hood_status")
-    if value is not None:
-        try:
-            return int(value) == 1
-        except (ValueError, TypeError):
-            return None
-    return None
-
-
-def is_door_open(data: dict[str, Any], door_key: str) -> bool | None:
-    """Check if a specific door is open (DoorStatus enum: 0=closed, 1=open)."""
-    value = get_telemetry_value(data, door_key)
-    if value is not None:
         try:
-            return int(value) == 1
+            return int(value) > 0
         except (ValueError, TypeError):
             return None
-    return None
+    try:
+        return int(value) == 1
+    except (ValueError, TypeError):
+        return None
 
 
-def is_any_door_open(data: dict[str, Any]) -> bool | None:
+def is_any_door_open(telemetry: dict[str, Any]) -> bool | None:
     """Check if any door is open (DoorStatus enum: 0=closed, 1=open)."""
-    # Check individual door statuses
-    door_keys = ["door_fl", "door_fr", "door_rl", "door_rr"]
-    any_found = False
-    for key in door_keys:
-        value = get_telemetry_value(data, key)
-        if value is not None:
-            any_found = True
-            try:
-                if int(value) == 1:  # Open
-                    return True
-            except (ValueError, TypeError):
-                pass
-    # If we found any door status, return False (all closed), otherwise None
-    return False if any_found else None
-
-
-def is_any_window_open(data: dict[str, Any]) -> bool | None:
-    """Check if any window is open."""
-    value = get_telemetry_value(data, "window_status")
-    if value is not None:
-        try:
-            # If non-zero, at least one window is open
-            return int(value) != 0
-        except (ValueError, TypeError):
-            return None
-    return None
+    values = [telemetry.get(key) for key in _DOOR_KEYS]
+    # No door status reported at all
+    if all(value is None for value in values):
+        return None
+    try:
+        return any(int(value) == 1 for value in values if value is not None)
+    except (ValueError, TypeError):
+        return None
 
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[VinFastBinarySensorEntityDescription, ...] = (
@@ -163,56 +98,59 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[VinFastBinarySensorEntityDescription, ...] = (
         translation_key="locked",
         device_class=BinarySensorDeviceClass.LOCK,
         icon="mdi:car-door-lock",
-        value_fn=lambda data: is_locked(data),
+        # VinFast API: 0=unlocked, 1=locked (from DoorsInfo.java)
+        # Home Assistant LOCK device class: is_on=True means UNLOCKED
+        value_fn=_make_eq("locked", target=0),
     ),
     VinFastBinarySensorEntityDescription(
         key="ignition",
         translation_key="ignition",
         device_class=BinarySensorDeviceClass.POWER,
         icon="mdi:car-key",
-        value_fn=lambda data: is_ignition_on(data),
+        value_fn=_make_eq("ignition"),
     ),
     VinFastBinarySensorEntityDescription(
         key="charging",
         translation_key="charging",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
         icon="mdi:ev-station",
-        value_fn=lambda data: is_charging(data),
+        value_fn=_make_eq("charging_status"),
     ),
     VinFastBinarySensorEntityDescription(
         key="plugged_in",
         translation_key="plugged_in",
         device_class=BinarySensorDeviceClass.PLUG,
         icon="mdi:power-plug",
-        value_fn=lambda data: is_plugged_in(data),
+        value_fn=is_plugged_in,
     ),
     VinFastBinarySensorEntityDescription(
         key="trunk_open",
         translation_key="trunk_open",
         device_class=BinarySensorDeviceClass.OPENING,
         icon="mdi:car-back",
-        value_fn=lambda data: is_trunk_open(data),
+        value_fn=_make_eq("trunk_status"),
     ),
     VinFastBinarySensorEntityDescription(
         key="hood_open",
         translation_key="hood_open",
         device_class=BinarySensorDeviceClass.OPENING,
         icon="mdi:car-lifted-pickup",
-        value_fn=lambda data: is_hood_open(data),
+        value_fn=_make_eq("hood_status"),
     ),
     VinFastBinarySensorEntityDescription(
         key="door_open",
         translation_key="door_open",
         device_class=BinarySensorDeviceClass.DOOR,
         icon="mdi:car-door",
-        value_fn=lambda data: is_any_door_open(data),
+        value_fn=is_any_door_open,
     ),
     VinFastBinarySensorEntityDescription(
         key="window_open",
         translation_key="window_open",
         device_class=BinarySensorDeviceClass.WINDOW,
         icon="mdi:car-door",
-        value_fn=lambda data: is_any_window_open(data),
+        # If non-zero, at least one window is open
+        value_fn=_make_eq("window_status", target=0, invert=True),
     ),
     # Individual door sensors
     VinFastBinarySensorEntityDescription(
@@ -220,28 +158,28 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[VinFastBinarySensorEntityDescription, ...] = (
         translation_key="door_front_left",
         device_class=BinarySensorDeviceClass.DOOR,
         icon="mdi:car-door",
-        value_fn=lambda data: is_door_open(data, "door_fl"),
+        value_fn=_make_eq("door_fl"),
     ),
     VinFastBinarySensorEntityDescription(
         key="door_front_right",
         translation_key="door_front_right",
         device_class=BinarySensorDeviceClass.DOOR,
         icon="mdi:car-door",
-        value_fn=lambda data: is_door_open(data, "door_fr"),
+        value_fn=_make_eq("door_fr"),
     ),
     VinFastBinarySensorEntityDescription(
         key="door_rear_left",
         translation_key="door_rear_left",
         device_class=BinarySensorDeviceClass.DOOR,
         icon="mdi:car-door",
-        value_fn=lambda data: is_door_open(data, "door_rl"),
+        value_fn=_make_eq("door_rl"),
     ),
     VinFastBinarySensorEntityDescription(
         key="door_rear_right",
         translation_key="door_rear_right",
         device_class=BinarySensorDeviceClass.DOOR,
         icon="mdi:car-door",
-        value_fn=lambda data: is_door_open(data, "door_rr"),
+        value_fn=_make_eq("door_rr"),
     ),
 )
 
@@ -277,31 +215,28 @@ class VinFastBinarySensor(CoordinatorEntity[VinFastDataUpdateCoordinator], Binar
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.vin}_{description.key}"
+        # Copy the static description fields so the base class reads them directly
+        self._attr_device_class = description.device_class
+        self._attr_icon = description.icon
+        self._attr_translation_key = description.translation_key
 
     @property
-    def device_info(self) -> DeviceInfo:
+    def device_info(self) -> DeviceInfo | None:
         """Return device information about this VinFast vehicle."""
-        vehicles = self.coordinator.data.get("vehicles", []) if self.coordinator.data else []
-        vehicle = vehicles[0] if vehicles else {}
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin or "unknown")},
-            name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
-            manufacturer="VinFast",
-            model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
-            sw_version=str(vehicle.get("yearOfProduct", "")),
-        )
+        return self.coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self.coordinator.data:
-            return self.entity_description.value_fn(self.coordinator.data)
-        return None
+        telemetry = self.coordinator.telemetry
+        if telemetry is None:
+            return None
+        return self.entity_description.value_fn(telemetry)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.last_update_success:
-            return False
-        return self.coordinator.data and self.coordinator.data.get("telemetry") is not None
+        return (
+            self.coordinator.last_update_success
+            and self.coordinator.telemetry_available
+        )
@@ -62,19 +62,20 @@ class VinFastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
                 # Get vehicles to verify access and get VIN for unique ID
                 vehicles = await api.get_vehicles()
+                vehicle = next(iter(vehicles), None)
 
-                if not vehicles:
+                if vehicle is None:
                     errors["base"] = "no_vehicles"
                 else:
                     # Use first VIN as unique ID
-                    vin = vehicles[0].get("vinCode", "unknown")
+                    vin = vehicle.get("vinCode", "unknown")
                     await self.async_set_unique_id(vin)
                     self._abort_if_unique_id_configured()
 
                     # Create entry with vehicle name
-                    vehicle_name = vehicles[0].get(
+                    vehicle_name = vehicle.get(
                         "customizedVehicleName",
-                        vehicles[0].get("vehicleName", "VinFast"),
+                        vehicle.get("vehicleName", "VinFast"),
                     )
 
                     return self.async_create_entry(
@@ -86,6 +87,9 @@ class VinFastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "invalid_auth"
             except VinFastApiError:
                 errors["base"] = "cannot_connect"
+            except (aiohttp.ClientError, ValueError, KeyError) as err:
+                _LOGGER.error("Error validating credentials: %s", err)
+                errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
@@ -196,13 +200,14 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
                     self._api.user_id,
                 )
 
-                # Generate keypair and CSR
-                self._pairing.generate_keypair()
+                # Generate keypair and CSR (CPU-bound, so off the event loop)
+                await self.hass.async_add_executor_job(self._pairing.generate_keypair)
                 device_id = str(uuid.uuid4())[:8]
-                csr = self._pairing.generate_csr(
+                csr = await self.hass.async_add_executor_job(
+                    self._pairing.generate_csr,
                     self._api.vin or "",
                     device_id,
-                    "HomeAssistant"
+                    "HomeAssistant",
                 )
 
                 # Encrypt CSR
@@ -227,7 +232,13 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
                 errors["base"] = "pairing_failed"
             except VinFastAuthError:
                 errors["base"] = "invalid_auth"
-            except Exception as err:
+            except VinFastApiError as err:
+                _LOGGER.error("API error during pairing: %s", err)
+                errors["base"] = "cannot_connect"
+            except (aiohttp.ClientError, ValueError, KeyError) as err:
+                _LOGGER.error("Pairing error: %s", err)
+                errors["base"] = "cannot_connect"
+            except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected pairing error: %s", err)
                 errors["base"] = "unknown"
 
@@ -276,7 +287,10 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
             except VinFastPairingError as err:
                 _LOGGER.error("OTP verification failed: %s", err)
                 errors["base"] = "invalid_otp"
-            except Exception as err:
+            except (aiohttp.ClientError, ValueError, KeyError) as err:
+                _LOGGER.error("Error sending pairing data: %s", err)
+                errors["base"] = "cannot_connect"
+            except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error: %s", err)
                 errors["base"] = "unknown"
 
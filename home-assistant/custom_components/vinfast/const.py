@@ -1,4 +1,5 @@
 """Constants for the VinFast integration."""
+from datetime import timedelta
 
 DOMAIN = "vinfast"
 
@@ -19,6 +20,8 @@ CONF_OCPP_CHARGING_STATE = "ocpp_charging_state"
 # Update intervals (seconds)
 UPDATE_INTERVAL_NORMAL = 14400  # 4 hours when idle
 UPDATE_INTERVAL_CHARGING = 300  # 5 minutes when charging via OCPP
+UPDATE_INTERVAL_NORMAL_TD = timedelta(seconds=UPDATE_INTERVAL_NORMAL)
+UPDATE_INTERVAL_CHARGING_TD = timedelta(seconds=UPDATE_INTERVAL_CHARGING)
 
 # Legacy - for backward compatibility
 UPDATE_INTERVAL = UPDATE_INTERVAL_NORMAL
@@ -1,7 +1,6 @@
 """Data update coordinator for VinFast."""
 from __future__ import annotations
 
-from datetime import timedelta
 import logging
 from typing import Any
 
@@ -9,14 +8,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import VinFastApi, VinFastApiError, VinFastAuthError
 from .const import (
     DOMAIN,
-    UPDATE_INTERVAL_NORMAL,
-    UPDATE_INTERVAL_CHARGING,
+    UPDATE_INTERVAL_NORMAL_TD,
+    UPDATE_INTERVAL_CHARGING_TD,
     CONF_OCPP_ENTITY,
     CONF_OCPP_CHARGING_STATE,
     DEFAULT_OCPP_CHARGER_ENTITY,
@@ -37,44 +37,95 @@ class VinFastDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL_NORMAL),
+            update_interval=UPDATE_INTERVAL_NORMAL_TD,
+            # Skip listener callbacks when a poll returns identical data, so
+            # entities that change local state must write it themselves
+            always_update=False,
         )
         self.config_entry = entry
         self._api: VinFastApi | None = None
         self._is_ocpp_charging: bool = False
+        # Options changes reload the entry, so this never goes stale
+        self._ocpp_charging_state: str = DEFAULT_OCPP_CHARGING_STATE
         self._unsub_charger_listener: callable | None = None
+        # Validated telemetry dict from the last successful update, for entities
+        self.telemetry: dict[str, Any] | None = None
+        self.telemetry_available: bool = False
+        # First vehicle from the last successful update, for entities
+        self.vehicle: dict[str, Any] | None = None
+        # Shared by all entities; rebuilt only when the vehicle metadata changes
+        self.device_info: DeviceInfo | None = None
+        self._device_info_fingerprint: tuple[Any, ...] | None = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from VinFast API."""
+        email = self.config_entry.data[CONF_EMAIL]
+        password = self.config_entry.data[CONF_PASSWORD]
+
         if self._api is None:
+            # Use HA's shared session: its connector already pools keep-alive
+            # connections and caches DNS, so no dedicated TCPConnector is needed
             session = async_get_clientsession(self.hass)
             self._api = VinFastApi(session)
 
             # Authenticate
             try:
-                await self._api.authenticate(
-                    self.config_entry.data[CONF_EMAIL],
-                    self.config_entry.data[CONF_PASSWORD],
-                )
+                await self._api.authenticate(email, password)
             except VinFastAuthError as err:
                 raise UpdateFailed(f"Authentication failed: {err}") from err
             except VinFastApiError as err:
                 raise UpdateFailed(f"API error: {err}") from err
 
-        try:
-            return await self._api.get_all_data()
-        except VinFastAuthError:
-            # Re-authenticate
+        # Second attempt only after re-authenticating
+        for attempt in range(2):
             try:
-                await self._api.authenticate(
-                    self.config_entry.data[CONF_EMAIL],
-                    self.config_entry.data[CONF_PASSWORD],
-                )
-                return await self._api.get_all_data()
-            except Exception as err:
-                raise UpdateFailed(f"Re-authentication failed: {err}") from err
-        except VinFastApiError as err:
-            raise UpdateFailed(f"Error fetching data: {err}") from err
+                data = await self._api.get_all_data()
+            except VinFastAuthError as err:
+                if attempt:
+                    raise UpdateFailed(f"Re-authentication failed: {err}") from err
+                try:
+                    await self._api.authenticate(email, password)
+                except Exception as auth_err:
+                    raise UpdateFailed(f"Re-authentication failed: {auth_err}") from auth_err
+            except VinFastApiError as err:
+                raise UpdateFailed(f"Error fetching data: {err}") from err
+            else:
+                telemetry = data.get("telemetry")
+                self.telemetry = telemetry if isinstance(telemetry, dict) else None
+                self.telemetry_available = self.telemetry is not None
+                vehicle = next(iter(data.get("vehicles") or ()), None)
+                self.vehicle = vehicle if isinstance(vehicle, dict) else None
+                self._update_device_info()
+                return data
+
+        raise UpdateFailed("Re-authentication failed")
+
+    def _update_device_info(self) -> None:
+        """Rebuild the shared device info if the vehicle metadata changed."""
+        vehicle = self.vehicle or {}
+        fingerprint = (
+            self.vin,
+            vehicle.get("customizedVehicleName"),
+            vehicle.get("vehicleName"),
+            vehicle.get("vehicleType"),
+            vehicle.get("vehicleVariant"),
+            vehicle.get("yearOfProduct"),
+        )
+        if fingerprint == self._device_info_fingerprint:
+            return
+        self._device_info_fingerprint = fingerprint
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.vin or "unknown")},
+            name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
+            manufacturer="VinFast",
+            model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
+            sw_version=str(vehicle.get("yearOfProduct", "")),
+        )
+
+    @property
+    def api(self) -> VinFastApi | None:
+        """Return the authenticated API client."""
+        return self._api
 
     @property
     def vin(self) -> str | None:
@@ -104,12 +155,12 @@ class VinFastDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.debug("No OCPP entity configured, skipping charger listener")
             return
 
-        ocpp_charging_state = self._get_ocpp_charging_state()
+        self._ocpp_charging_state = self._get_ocpp_charging_state()
 
         # Check initial state
         charger_state = self.hass.states.get(ocpp_entity)
         if charger_state:
-            self._is_ocpp_charging = charger_state.state == ocpp_charging_state
+            self._is_ocpp_charging = charger_state.state == self._ocpp_charging_state
             self._update_polling_interval()
             _LOGGER.debug(
                 "Initial OCPP charger state: %s (charging=%s)",
@@ -133,33 +184,36 @@ class VinFastDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         was_charging = self._is_ocpp_charging
-        ocpp_charging_state = self._get_ocpp_charging_state()
-        self._is_ocpp_charging = new_state.state == ocpp_charging_state
+        self._is_ocpp_charging = new_state.state == self._ocpp_charging_state
 
         if was_charging != self._is_ocpp_charging:
-            _LOGGER.debug(
-                "OCPP charger state changed: %s -> %s (charging=%s)",
-                event.data.get("old_state", {}).state if event.data.get("old_state") else "unknown",
-                new_state.state,
-                self._is_ocpp_charging,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                old_state = event.data.get("old_state")
+                _LOGGER.debug(
+                    "OCPP charger state changed: %s -> %s (charging=%s)",
+                    old_state.state if old_state else "unknown",
+                    new_state.state,
+                    self._is_ocpp_charging,
+                )
             self._update_polling_interval()
 
-            # If charging started, trigger an immediate refresh
+            # If charging started, trigger an immediate refresh. Schedule it on
+            # the debouncer directly rather than wrapping it in a new task.
             if self._is_ocpp_charging:
-                self.hass.async_create_task(self.async_request_refresh())
+                self._debounced_refresh.async_schedule_call()
 
     def _update_polling_interval(self) -> None:
         """Update the polling interval based on charging state."""
         if self._is_ocpp_charging:
-            new_interval = timedelta(seconds=UPDATE_INTERVAL_CHARGING)
             _LOGGER.debug("OCPP charging detected - switching to 5-minute polling")
         else:
-            new_interval = timedelta(seconds=UPDATE_INTERVAL_NORMAL)
             _LOGGER.debug("Not charging - switching to 4-hour polling")
 
-        if self.update_interval != new_interval:
-            self.update_interval = new_interval
+        self.update_interval = (
+            UPDATE_INTERVAL_CHARGING_TD
+            if self._is_ocpp_charging
+            else UPDATE_INTERVAL_NORMAL_TD
+        )
 
     def async_unsubscribe(self) -> None:
         """Unsubscribe from charger state changes."""
@@ -6,7 +6,7 @@ from typing import Any
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -15,6 +15,16 @@ from .const import DOMAIN
 from .coordinator import VinFastDataUpdateCoordinator
 
 
+def _to_float(value: Any) -> float | None:
+    """Convert a telemetry value to float, or None if missing or invalid."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -38,19 +48,35 @@ class VinFastDeviceTracker(CoordinatorEntity[VinFastDataUpdateCoordinator], Trac
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.vin}_location"
 
+        self._lat: float | None = None
+        self._lon: float | None = None
+        self._update_location()
+        # Last written state, so an unchanged position skips the state write
+        self._last_coord = (self._lat, self._lon)
+        self._last_available = coordinator.last_update_success
+
     @property
-    def device_info(self) -> DeviceInfo:
+    def device_info(self) -> DeviceInfo | None:
         """Return device information about this VinFast vehicle."""
-        vehicles = self.coordinator.data.get("vehicles", []) if self.coordinator.data else []
-        vehicle = vehicles[0] if vehicles else {}
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin or "unknown")},
-            name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
-            manufacturer="VinFast",
-            model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
-            sw_version=str(vehicle.get("yearOfProduct", "")),
-        )
+        return self.coordinator.device_info
+
+    def _update_location(self) -> None:
+        """Parse the coordinates from the latest telemetry."""
+        telemetry = self.coordinator.telemetry or {}
+        self._lat = _to_float(telemetry.get("latitude"))
+        self._lon = _to_float(telemetry.get("longitude"))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_location()
+        coord = (self._lat, self._lon)
+        available = self.coordinator.last_update_success
+        if coord == self._last_coord and available == self._last_available:
+            return
+        self._last_coord = coord
+        self._last_available = available
+        super()._handle_coordinator_update()
 
     @property
     def source_type(self) -> SourceType:
@@ -60,35 +86,19 @@ class VinFastDeviceTracker(CoordinatorEntity[VinFastDataUpdateCoordinator], Trac
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        if self.coordinator.data:
-            telemetry = self.coordinator.data.get("telemetry")
-            if telemetry and isinstance(telemetry, dict):
-                lat = telemetry.get("latitude")
-                if lat is not None:
-                    try:
-                        return float(lat)
-                    except (ValueError, TypeError):
-                        pass
-        return None
+        return self._lat
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        if self.coordinator.data:
-            telemetry = self.coordinator.data.get("telemetry")
-            if telemetry and isinstance(telemetry, dict):
-                lon = telemetry.get("longitude")
-                if lon is not None:
-                    try:
-                        return float(lon)
-                    except (ValueError, TypeError):
-                        pass
-        return None
+        return self._lon
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.last_update_success:
-            return False
         # Only available if we have location data
-        return self.latitude is not None and self.longitude is not None
+        return (
+            self.coordinator.last_update_success
+            and self._lat is not None
+            and self._lon is not None
+        )
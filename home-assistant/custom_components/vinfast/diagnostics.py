@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from .const import DOMAIN
 from .coordinator import VinFastDataUpdateCoordinator
 
-TO_REDACT = {
+TO_REDACT: frozenset[str] = frozenset({
     CONF_EMAIL,
     CONF_PASSWORD,
     "vinCode",
@@ -23,7 +23,7 @@ TO_REDACT = {
     "pairing_keys",
     "access_token",
     "refresh_token",
-}
+})
 
 
 async def async_get_config_entry_diagnostics(
@@ -38,15 +38,16 @@ async def async_get_config_entry_diagnostics(
             "version": entry.version,
             "domain": entry.domain,
             "title": entry.title,
-            "data": async_redact_data(dict(entry.data), TO_REDACT),
-            "options": async_redact_data(dict(entry.options), TO_REDACT),
+            "data": dict(entry.data),
+            "options": dict(entry.options),
         },
         "coordinator": {
             "vin": "**REDACTED**" if coordinator.vin else None,
             "last_update_success": coordinator.last_update_success,
             "update_interval": str(coordinator.update_interval),
         },
-        "data": async_redact_data(coordinator.data, TO_REDACT) if coordinator.data else None,
+        "data": coordinator.data or None,
     }
 
-    return diagnostics_data
+    # Redact everything in a single pass over the combined payload
+    return async_redact_data(diagnostics_data, TO_REDACT)
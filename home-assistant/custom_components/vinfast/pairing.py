@@ -1,14 +1,16 @@
 """VinFast Remote Control Pairing Module."""
 from __future__ import annotations
 
+import asyncio
 import base64
+from binascii import b2a_base64
 import hashlib
 import hmac
-import json
 import logging
 import os
 import secrets
 import time
+from collections.abc import Callable
 from typing import Any
 
 from cryptography.hazmat.primitives import hashes, serialization
@@ -17,7 +19,7 @@ from cryptography.x509.oid import NameOID
 from cryptography import x509
 
 import aiohttp
-import async_timeout
+import orjson
 
 from .const import API_BASE
 
@@ -29,11 +31,37 @@ VERIFY_SESSION_ENDPOINT = "/ccaraccessmgmt/api/v1/pairing/app/verify-session"
 SEND_PAIR_DATA_ENDPOINT = "/ccaraccessmgmt/api/v1/pairing/app/send-pair-data"
 COMMAND_ENDPOINT = "/ccaraccessmgmt/api/v2/remote/app/command"
 
+# Fields every pairing QR code must contain
+_QR_REQUIRED = frozenset({"K", "ssid", "vin", "timeout"})
+
+# Hash constructor for the user_id hash in sign_command
+_SHA256 = hashlib.sha256
+
+# Backslash-escapes the RDN special characters in CSR subject values
+_CSR_ESCAPE = str.maketrans({char: f"\\{char}" for char in ",=+<>#;"})
+
+
+def _b64(data: bytes) -> str:
+    """Return standard base64 of data as str, without a trailing newline."""
+    return b2a_base64(data, newline=False).decode("ascii")
+
+
+async def _read_error_snippet(response: aiohttp.ClientResponse) -> str:
+    """Return at most the first 2 KiB of an error response body as text.
+
+    The whole body is read so the connection can go back to the pool.
+    """
+    return (await response.read())[:2048].decode("utf-8", "replace")
+
 
 class VinFastPairingError(Exception):
     """Exception for pairing errors."""
 
 
+class VinFastPairingAuthError(VinFastPairingError):
+    """Exception for a rejected access token."""
+
+
 class VinFastPairing:
     """Handles VinFast remote control pairing and command signing."""
 
@@ -48,12 +76,33 @@ class VinFastPairing:
         self._vin: str | None = None
         self._user_id: str | None = None
         self._is_paired: bool = False
+        # Signing callable and its padding/hash objects, cached once paired
+        self._sign: Callable[..., bytes] | None = None
+        self._pkcs1: padding.PKCS1v15 | None = None
+        self._sha256: hashes.SHA256 | None = None
+        # user_id is stable, so its hash is computed once per pairing object
+        self._cached_user_id: str | None = None
+        self._cached_user_id_hash: str | None = None
+        # Request headers for the last access token used
+        self._headers_token: str | None = None
+        self._headers: dict[str, str] = {}
 
     @property
     def is_paired(self) -> bool:
         """Return True if paired and ready to send commands."""
         return self._is_paired and self._private_key is not None and self._shared_key is not None
 
+    def _auth_headers(self, access_token: str) -> dict[str, str]:
+        """Return request headers, rebuilt only when the access token changes."""
+        if access_token != self._headers_token:
+            self._headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            }
+            self._headers_token = access_token
+        return self._headers
+
     def parse_qr_code(self, qr_content: str) -> dict[str, str]:
         """Parse VinFast pairing QR code.
 
@@ -62,17 +111,18 @@ class VinFastPairing:
         if not qr_content:
             raise VinFastPairingError("Empty QR code content")
 
-        params = {}
-        for pair in qr_content.split("&"):
-            if "=" in pair:
-                key, value = pair.split("=", 1)
-                params[key.strip()] = value.strip()
+        # Values are taken verbatim: K is standard base64, whose "+" characters
+        # a URL query parser would decode to spaces
+        params = {
+            key.strip(): value.strip()
+            for key, sep, value in (pair.partition("=") for pair in qr_content.split("&"))
+            if sep
+        }
 
         # Validate required fields
-        required = ["K", "ssid", "vin", "timeout"]
-        missing = [k for k in required if k not in params]
+        missing = _QR_REQUIRED - params.keys()
         if missing:
-            raise VinFastPairingError(f"QR code missing required fields: {missing}")
+            raise VinFastPairingError(f"QR code missing required fields: {sorted(missing)}")
 
         return params
 
@@ -122,10 +172,7 @@ class VinFastPairing:
             raise VinFastPairingError("Private key not generated")
 
         # Escape special characters in device name
-        special_chars = [',', '=', '+', '<', '>', '#', ';']
-        escaped_name = device_name
-        for char in special_chars:
-            escaped_name = escaped_name.replace(char, f"\\{char}")
+        escaped_name = device_name.translate(_CSR_ESCAPE)
 
         # Build CSR
         csr_builder = x509.CertificateSigningRequestBuilder()
@@ -142,35 +189,18 @@ class VinFastPairing:
         return csr_pem
 
     def encrypt_csr(self, csr_pem: str, qr_key_b64: str, vin: str) -> tuple[str, str]:
-        """Encrypt CSR for transmission.
+        """Encode CSR for transmission.
 
-        Uses HMAC-SHA256 with key derived from QR code.
+        The APK appears to encrypt the CSR, but the server may accept the
+        plain base64-encoded CSR if the request is properly authenticated,
+        so qr_key_b64 and vin are currently unused.
         Returns: (encrypted_csr_b64, seed_b64)
         """
-        # Decode the shared key from QR code
-        qr_key = base64.b64decode(qr_key_b64)
-
         # Generate random seed (16 bytes)
         seed = secrets.token_hex(16)  # 32 hex chars = 16 bytes
 
-        # Generate encryption key using HMAC-SHA256
-        # key1 = HMAC-SHA256(qr_key, vin_bytes, seed_bytes)
-        vin_bytes = vin.encode("utf-8")
-        seed_bytes = seed.encode("utf-8")
-        key1 = hmac.new(qr_key, vin_bytes + seed_bytes, hashlib.sha256).digest()
-
-        # Encrypt CSR: encrypted = AES-encrypt(key1, csr) or simpler XOR/base64
-        # Based on APK analysis, it uses: base64(HMAC-SHA256(key1, csr_bytes, seed_bytes))
-        csr_bytes = csr_pem.encode("utf-8")
-        encrypted_csr = hmac.new(key1, csr_bytes + seed_bytes, hashlib.sha256).digest()
-        encrypted_csr_b64 = base64.b64encode(encrypted_csr).decode("utf-8")
-
-        # Actually, looking at the APK more closely, it seems to use AES encryption
-        # Let me try a simpler approach - just base64 encode and send
-        # The server may accept plaintext CSR if properly authenticated
-        encrypted_csr_b64 = base64.b64encode(csr_bytes).decode("utf-8")
-
-        seed_b64 = base64.b64encode(seed_bytes).decode("utf-8")
+        encrypted_csr_b64 = base64.b64encode(csr_pem.encode("utf-8")).decode("utf-8")
+        seed_b64 = base64.b64encode(seed.encode("utf-8")).decode("utf-8")
 
         return encrypted_csr_b64, seed_b64
 
@@ -195,21 +225,17 @@ class VinFastPairing:
             "retry": retry,
         }
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        headers = self._auth_headers(access_token)
 
         try:
-            async with async_timeout.timeout(30):
+            async with asyncio.timeout(30):
                 url = f"{PAIRING_BASE}{VERIFY_SESSION_ENDPOINT}"
-                async with self._session.post(url, json=payload, headers=headers) as response:
+                async with self._session.post(url, data=orjson.dumps(payload), headers=headers) as response:
                     if response.status == 200:
                         _LOGGER.info("Verify session successful - OTP sent")
                         return True
                     else:
-                        text = await response.text()
+                        text = await _read_error_snippet(response)
                         _LOGGER.error("Verify session failed: %s - %s", response.status, text)
                         raise VinFastPairingError(f"Verify session failed: {text}")
         except aiohttp.ClientError as err:
@@ -238,16 +264,12 @@ class VinFastPairing:
             "sessionId": session_id,
         }
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        headers = self._auth_headers(access_token)
 
         try:
-            async with async_timeout.timeout(30):
+            async with asyncio.timeout(30):
                 url = f"{PAIRING_BASE}{SEND_PAIR_DATA_ENDPOINT}"
-                async with self._session.post(url, json=payload, headers=headers) as response:
+                async with self._session.post(url, data=orjson.dumps(payload), headers=headers) as response:
                     if response.status == 200:
                         data = await response.json()
                         _LOGGER.info("Pairing successful!")
@@ -257,7 +279,7 @@ class VinFastPairing:
                         self._process_pair_response(response_data)
                         return response_data
                     else:
-                        text = await response.text()
+                        text = await _read_error_snippet(response)
                         _LOGGER.error("Send pair data failed: %s - %s", response.status, text)
                         raise VinFastPairingError(f"Pairing failed: {text}")
         except aiohttp.ClientError as err:
@@ -279,9 +301,18 @@ class VinFastPairing:
             except Exception as err:
                 _LOGGER.warning("Failed to decode shared key: %s", err)
 
+        self._cache_signer()
         self._is_paired = True
         _LOGGER.info("Pairing keys stored successfully")
 
+    def _cache_signer(self) -> None:
+        """Cache the private key's sign method and its padding/hash objects."""
+        if self._private_key is None:
+            return
+        self._sign = self._private_key.sign
+        self._pkcs1 = padding.PKCS1v15()
+        self._sha256 = hashes.SHA256()
+
     def sign_command(
         self,
         message_name: str,
@@ -293,32 +324,28 @@ class VinFastPairing:
 
         Returns the complete signed request payload.
         """
-        if not self._private_key or not self._shared_key:
+        if not self._sign or not self._shared_key:
             raise VinFastPairingError("Not paired - cannot sign commands")
 
         timestamp = str(int(time.time() * 1000))
-        message_content_json = json.dumps(message_content, separators=(',', ':'))
-        message_content_b64 = base64.b64encode(message_content_json.encode("utf-8")).decode("utf-8")
-
-        # signature = SHA256withRSA(privateKey, timestamp_bytes + message_b64_bytes)
-        data_to_sign = timestamp.encode("utf-8") + message_content_b64.encode("utf-8")
-        signature = self._private_key.sign(
-            data_to_sign,
-            padding.PKCS1v15(),
-            hashes.SHA256()
-        )
-        signature_b64 = base64.b64encode(signature).decode("utf-8")
+        # orjson emits compact UTF-8 bytes, so there is no str round trip
+        message_content_b64_bytes = b2a_base64(orjson.dumps(message_content), newline=False)
+        message_content_b64 = message_content_b64_bytes.decode("ascii")
 
-        # signature2 = base64(HMAC-SHA256(sharedKey, timestamp_bytes + message_b64_bytes))
-        hmac_data = timestamp.encode("utf-8") + message_content_b64.encode("utf-8")
-        signature2 = base64.b64encode(
-            hmac.new(self._shared_key, hmac_data, hashlib.sha256).digest()
-        ).decode("utf-8")
+        # Both signatures cover the same bytes: timestamp_bytes + message_b64_bytes
+        data_to_sign = timestamp.encode("utf-8") + message_content_b64_bytes
+
+        # signature = SHA256withRSA(privateKey, data_to_sign)
+        signature_b64 = _b64(self._sign(data_to_sign, self._pkcs1, self._sha256))
+
+        # signature2 = base64(HMAC-SHA256(sharedKey, data_to_sign))
+        signature2 = _b64(hmac.digest(self._shared_key, data_to_sign, "sha256"))
 
         # user_id = base64(SHA256(userid_bytes))
-        user_id_hash = base64.b64encode(
-            hashlib.sha256(user_id.encode("utf-8")).digest()
-        ).decode("utf-8")
+        if user_id != self._cached_user_id:
+            self._cached_user_id_hash = _b64(_SHA256(user_id.encode("utf-8")).digest())
+            self._cached_user_id = user_id
+        user_id_hash = self._cached_user_id_hash
 
         return {
             "message_name": message_name,
@@ -345,6 +372,7 @@ class VinFastPairing:
         """Send a signed remote control command.
 
         device_key format: objectId_instanceId_resourceId (e.g., "3416_0_5850")
+        Raises VinFastPairingAuthError if the access token is rejected.
         """
         message_content = {
             "deviceKey": device_key,
@@ -358,22 +386,22 @@ class VinFastPairing:
             session_id=session_id,
         )
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        headers = self._auth_headers(access_token)
 
         try:
-            async with async_timeout.timeout(60):  # Commands may take time
+            async with asyncio.timeout(60):  # Commands may take time
                 url = f"{PAIRING_BASE}{COMMAND_ENDPOINT}"
-                async with self._session.post(url, json=signed_payload, headers=headers) as response:
+                async with self._session.post(url, data=orjson.dumps(signed_payload), headers=headers) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        _LOGGER.info("Command sent successfully: %s", data)
+                        # The response body is only used for debug logging
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug("Command response: %s", await response.json())
+                        _LOGGER.info("Command sent successfully")
                         return True
+                    elif response.status == 401:
+                        raise VinFastPairingAuthError("Access token rejected")
                     else:
-                        text = await response.text()
+                        text = await _read_error_snippet(response)
                         _LOGGER.error("Command failed: %s - %s", response.status, text)
                         return False
         except aiohttp.ClientError as err:
@@ -407,6 +435,7 @@ class VinFastPairing:
                 self._shared_key = base64.b64decode(shared_key_b64)
                 self._shared_key_b64 = shared_key_b64
                 self._session_id = session_id
+                self._cache_signer()
                 self._is_paired = True
                 _LOGGER.info("Pairing keys imported successfully")
                 return True
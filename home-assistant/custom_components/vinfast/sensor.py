@@ -4,7 +4,8 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Literal
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -21,7 +22,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -34,30 +35,52 @@ _LOGGER = logging.getLogger(__name__)
 
 @dataclass(frozen=True)
 class VinFastSensorEntityDescription(SensorEntityDescription):
-    """Describes VinFast sensor entity."""
+    """Describes VinFast sensor entity.
 
-    value_fn: Callable[[dict[str, Any]], Any] = lambda x: None
+    Simple sensors read source_key from the coordinator's cached telemetry
+    or first vehicle, then apply convert. Composite sensors set value_fn,
+    which receives the (telemetry, vehicle) dicts instead.
+    """
 
+    source: Literal["telemetry", "vehicle"] = "telemetry"
+    source_key: str | None = None
+    convert: Callable[[Any], Any] | None = None
+    value_fn: Callable[[dict[str, Any], dict[str, Any]], Any] | None = None
 
-def get_vehicle_value(data: dict[str, Any], key: str) -> Any:
-    """Get a value from vehicle data."""
-    vehicles = data.get("vehicles", [])
-    if vehicles:
-        return vehicles[0].get(key)
-    return None
 
+# Unit conversion constants
+KM_TO_MILES = 0.621371
+KPA_TO_PSI = 0.145038
 
-def get_odometer_miles(data: dict[str, Any]) -> float | None:
+# Gear position codes (GearStatus.java) and charging status codes
+_GEAR_MAP = MappingProxyType({0: "OFF", 1: "P", 2: "R", 3: "N", 4: "D"})
+_CHARGING_MAP = MappingProxyType({
+    0: "Not Charging",
+    1: "Charging",
+    2: "Complete",
+    3: "Scheduled",
+    4: "Error",
+})
+
+# Sensors that are only available when we have telemetry data
+# Note: odometer is NOT in this set since it falls back to vehicle info
+_TELEMETRY_ONLY = frozenset({
+    "battery_level", "range", "time_to_full",
+    "charging_status", "charge_limit", "speed", "gear",
+    "outside_temp", "inside_temp", "tire_pressure_fl", "tire_pressure_fr",
+    "tire_pressure_rl", "tire_pressure_rr",
+})
+
+
+def get_odometer_miles(telemetry: dict[str, Any], vehicle: dict[str, Any]) -> float | None:
     """Get odometer from telemetry (preferred) or vehicle info (fallback).
 
     The real-time odometer comes from VEHICLE_STATUS_ODOMETER telemetry alias.
     Falls back to vehicle-info endpoint which may have stale data.
     API returns values in kilometers - we convert to miles.
     """
-    KM_TO_MILES = 0.621371
-
     # First, try the real-time odometer from telemetry (VEHICLE_STATUS_ODOMETER alias)
-    odometer_value = get_telemetry_value(data, "odometer")
+    odometer_value = telemetry.get("odometer")
     if odometer_value is not None:
         try:
             val_km = float(odometer_value)
@@ -71,7 +94,7 @@ def get_odometer_miles(data: dict[str, Any]) -> float | None:
             pass
 
     # Fallback to vehicle info (may be stale/cached) - also in km
-    value = get_vehicle_value(data, "odometer")
+    value = vehicle.get("odometer")
     if value is not None:
         try:
             val_km = float(value)
@@ -85,65 +108,41 @@ def get_odometer_miles(data: dict[str, Any]) -> float | None:
     return None
 
 
-def get_telemetry_value(data: dict[str, Any], key: str) -> Any:
-    """Get a value from telemetry data."""
-    telemetry = data.get("telemetry")
-    if telemetry and isinstance(telemetry, dict):
-        return telemetry.get(key)
-    return None
-
-
-# Unit conversion constants
-KM_TO_MILES = 0.621371
-KPA_TO_PSI = 0.145038
+def get_vehicle_name(telemetry: dict[str, Any], vehicle: dict[str, Any]) -> str | None:
+    """Get the user's vehicle name, falling back to the model name."""
+    return vehicle.get("customizedVehicleName") or vehicle.get("vehicleName")
 
 
-def get_range_miles(data: dict[str, Any]) -> float | None:
-    """Convert range from km to miles."""
-    value = get_telemetry_value(data, "range")
-    if value is not None:
-        try:
-            return round(float(value) * KM_TO_MILES, 1)
-        except (ValueError, TypeError):
-            pass
-    return None
+def get_vehicle_model(telemetry: dict[str, Any], vehicle: dict[str, Any]) -> str:
+    """Get the vehicle model as "<type> <variant>"."""
+    return f"{vehicle.get('vehicleType')} {vehicle.get('vehicleVariant')}".strip()
 
 
-def get_speed_mph(data: dict[str, Any]) -> float | None:
-    """Convert speed from km/h to mph."""
-    value = get_telemetry_value(data, "speed")
-    if value is not None:
-        try:
-            return round(float(value) * KM_TO_MILES, 1)
-        except (ValueError, TypeError):
-            pass
-    return None
+def km_to_miles(value: Any) -> float | None:
+    """Convert a distance (km) or speed (km/h) to miles or mph."""
+    try:
+        return round(float(value) * KM_TO_MILES, 1)
+    except (ValueError, TypeError):
+        return None
 
 
-def get_tire_pressure_psi(data: dict[str, Any], key: str) -> float | None:
+def kpa_to_psi(value: Any) -> float | None:
     """Convert tire pressure from kPa to PSI."""
-    value = get_telemetry_value(data, key)
-    if value is not None:
-        try:
-            return round(float(value) * KPA_TO_PSI, 1)
-        except (ValueError, TypeError):
-            pass
-    return None
+    try:
+        return round(float(value) * KPA_TO_PSI, 1)
+    except (ValueError, TypeError):
+        return None
 
 
-def get_temperature_f(data: dict[str, Any], key: str) -> float | None:
+def celsius_to_fahrenheit(value: Any) -> float | None:
     """Convert temperature from Celsius to Fahrenheit."""
-    value = get_telemetry_value(data, key)
-    if value is not None:
-        try:
-            celsius = float(value)
-            return round((celsius * 9 / 5) + 32, 1)
-        except (ValueError, TypeError):
-            pass
-    return None
+    try:
+        return round((float(value) * 9 / 5) + 32, 1)
+    except (ValueError, TypeError):
+        return None
 
 
-def get_gear_position(data: dict[str, Any]) -> str | None:
+def get_gear_position(value: Any) -> str:
     """Convert gear position number to letter.
 
     From GearStatus.java in VinFast APK:
@@ -153,32 +152,18 @@ def get_gear_position(data: dict[str, Any]) -> str | None:
     - 3 = N (Neutral)
     - 4 = D (Drive)
     """
-    value = get_telemetry_value(data, "gear")
-    if value is not None:
-        try:
-            gear_map = {0: "OFF", 1: "P", 2: "R", 3: "N", 4: "D"}
-            return gear_map.get(int(value), str(value))
-        except (ValueError, TypeError):
-            return str(value)
-    return None
+    try:
+        return _GEAR_MAP.get(int(value), str(value))
+    except (ValueError, TypeError):
+        return str(value)
 
 
-def get_charging_status_text(data: dict[str, Any]) -> str | None:
+def get_charging_status_text(value: Any) -> str:
     """Convert charging status code to text."""
-    value = get_telemetry_value(data, "charging_status")
-    if value is not None:
-        try:
-            status_map = {
-                0: "Not Charging",
-                1: "Charging",
-                2: "Complete",
-                3: "Scheduled",
-                4: "Error",
-            }
-            return status_map.get(int(value), f"Unknown ({value})")
-        except (ValueError, TypeError):
-            return str(value)
-    return None
+    try:
+        return _CHARGING_MAP.get(int(value), f"Unknown ({value})")
+    except (ValueError, TypeError):
+        return str(value)
 
 
 SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
@@ -190,38 +175,40 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:counter",
-        value_fn=lambda data: get_odometer_miles(data),  # API returns km, convert to miles
+        value_fn=get_odometer_miles,  # API returns km, convert to miles
     ),
     VinFastSensorEntityDescription(
         key="vehicle_name",
         translation_key="vehicle_name",
         icon="mdi:car",
-        value_fn=lambda data: get_vehicle_value(data, "customizedVehicleName")
-        or get_vehicle_value(data, "vehicleName"),
+        value_fn=get_vehicle_name,
     ),
     VinFastSensorEntityDescription(
         key="model",
         translation_key="model",
         icon="mdi:car-info",
-        value_fn=lambda data: f"{get_vehicle_value(data, 'vehicleType')} {get_vehicle_value(data, 'vehicleVariant')}".strip(),
+        value_fn=get_vehicle_model,
     ),
     VinFastSensorEntityDescription(
         key="year",
         translation_key="year",
         icon="mdi:calendar",
-        value_fn=lambda data: get_vehicle_value(data, "yearOfProduct"),
+        source="vehicle",
+        source_key="yearOfProduct",
     ),
     VinFastSensorEntityDescription(
         key="color",
         translation_key="color",
         icon="mdi:palette",
-        value_fn=lambda data: get_vehicle_value(data, "exteriorColor"),
+        source="vehicle",
+        source_key="exteriorColor",
     ),
     VinFastSensorEntityDescription(
         key="vin",
         translation_key="vin",
         icon="mdi:identifier",
-        value_fn=lambda data: get_vehicle_value(data, "vinCode"),
+        source="vehicle",
+        source_key="vinCode",
     ),
     # ==================== Battery & Charging Sensors ====================
     VinFastSensorEntityDescription(
@@ -231,7 +218,7 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:battery",
-        value_fn=lambda data: get_telemetry_value(data, "battery_level"),
+        source_key="battery_level",
     ),
     VinFastSensorEntityDescription(
         key="range",
@@ -240,7 +227,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:map-marker-distance",
-        value_fn=lambda data: get_range_miles(data),  # API returns km, convert to miles
+        source_key="range",
+        convert=km_to_miles,  # API returns km, convert to miles
     ),
     VinFastSensorEntityDescription(
         key="time_to_full",
@@ -249,20 +237,21 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:timer",
-        value_fn=lambda data: get_telemetry_value(data, "time_to_full"),
+        source_key="time_to_full",
     ),
     VinFastSensorEntityDescription(
         key="charging_status",
         translation_key="charging_status",
         icon="mdi:ev-station",
-        value_fn=lambda data: get_charging_status_text(data),
+        source_key="charging_status",
+        convert=get_charging_status_text,
     ),
     VinFastSensorEntityDescription(
         key="charge_limit",
         translation_key="charge_limit",
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:battery-charging-high",
-        value_fn=lambda data: get_telemetry_value(data, "charge_limit"),
+        source_key="charge_limit",
     ),
     # ==================== Speed & Driving Sensors ====================
     VinFastSensorEntityDescription(
@@ -272,13 +261,15 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SPEED,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:speedometer",
-        value_fn=lambda data: get_speed_mph(data),  # API returns km/h, convert to mph
+        source_key="speed",
+        convert=km_to_miles,  # API returns km/h, convert to mph
     ),
     VinFastSensorEntityDescription(
         key="gear",
         translation_key="gear",
         icon="mdi:car-shift-pattern",
-        value_fn=lambda data: get_gear_position(data),
+        source_key="gear",
+        convert=get_gear_position,
     ),
     # ==================== Temperature Sensors ====================
     VinFastSensorEntityDescription(
@@ -288,7 +279,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
-        value_fn=lambda data: get_temperature_f(data, "outside_temp"),  # API returns C, convert to F
+        source_key="outside_temp",
+        convert=celsius_to_fahrenheit,  # API returns C, convert to F
     ),
     VinFastSensorEntityDescription(
         key="inside_temp",
@@ -297,7 +289,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
-        value_fn=lambda data: get_temperature_f(data, "inside_temp"),  # API returns C, convert to F
+        source_key="inside_temp",
+        convert=celsius_to_fahrenheit,  # API returns C, convert to F
     ),
     # ==================== Tire Pressure Sensors (kPa -> PSI) ====================
     VinFastSensorEntityDescription(
@@ -307,7 +300,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-tire-alert",
-        value_fn=lambda data: get_tire_pressure_psi(data, "tire_pressure_fl"),  # API returns kPa
+        source_key="tire_pressure_fl",
+        convert=kpa_to_psi,  # API returns kPa
     ),
     VinFastSensorEntityDescription(
         key="tire_pressure_fr",
@@ -316,7 +310,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-tire-alert",
-        value_fn=lambda data: get_tire_pressure_psi(data, "tire_pressure_fr"),  # API returns kPa
+        source_key="tire_pressure_fr",
+        convert=kpa_to_psi,  # API returns kPa
     ),
     VinFastSensorEntityDescription(
         key="tire_pressure_rl",
@@ -325,7 +320,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-tire-alert",
-        value_fn=lambda data: get_tire_pressure_psi(data, "tire_pressure_rl"),  # API returns kPa
+        source_key="tire_pressure_rl",
+        convert=kpa_to_psi,  # API returns kPa
     ),
     VinFastSensorEntityDescription(
         key="tire_pressure_rr",
@@ -334,7 +330,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-tire-alert",
-        value_fn=lambda data: get_tire_pressure_psi(data, "tire_pressure_rr"),  # API returns kPa
+        source_key="tire_pressure_rr",
+        convert=kpa_to_psi,  # API returns kPa
     ),
 )
 
@@ -370,41 +367,42 @@ class VinFastSensor(CoordinatorEntity[VinFastDataUpdateCoordinator], SensorEntit
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.vin}_{description.key}"
+        self._attr_native_value = self._compute_native_value()
 
     @property
-    def device_info(self) -> DeviceInfo:
+    def device_info(self) -> DeviceInfo | None:
         """Return device information about this VinFast vehicle."""
-        vehicles = self.coordinator.data.get("vehicles", []) if self.coordinator.data else []
-        vehicle = vehicles[0] if vehicles else {}
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin or "unknown")},
-            name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
-            manufacturer="VinFast",
-            model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
-            sw_version=str(vehicle.get("yearOfProduct", "")),
-        )
-
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.entity_description.value_fn(self.coordinator.data)
-        return None
+        return self.coordinator.device_info
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Convert the sensor value once per coordinator update."""
+        self._attr_native_value = self._compute_native_value()
+        super()._handle_coordinator_update()
+
+    def _compute_native_value(self) -> Any:
+        """Read and convert the sensor value from the coordinator caches."""
+        description = self.entity_description
+        telemetry = self.coordinator.telemetry
+        vehicle = self.coordinator.vehicle
+        if description.value_fn is not None:
+            if telemetry is None and vehicle is None:
+                return None
+            return description.value_fn(telemetry or {}, vehicle or {})
+
+        source = telemetry if description.source == "telemetry" else vehicle
+        if not source:
+            return None
+        value = source.get(description.source_key)
+        if value is None or description.convert is None:
+            return value
+        return description.convert(value)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         if not self.coordinator.last_update_success:
             return False
-        # Telemetry-only sensors are only available when we have telemetry data
-        # Note: odometer is NOT in this list since it falls back to vehicle info
-        telemetry_only_sensors = (
-            "battery_level", "range", "time_to_full",
-            "charging_status", "charge_limit", "speed", "gear",
-            "outside_temp", "inside_temp", "tire_pressure_fl", "tire_pressure_fr",
-            "tire_pressure_rl", "tire_pressure_rr",
-        )
-        if self.entity_description.key in telemetry_only_sensors:
-            return self.coordinator.data and self.coordinator.data.get("telemetry") is not None
+        if self.entity_description.key in _TELEMETRY_ONLY:
+            return self.coordinator.telemetry_available
         return True
@@ -1,19 +1,22 @@
 """Switch platform for VinFast integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import VinFastDataUpdateCoordinator
-from .pairing import VinFastPairing, CONTROL_ALIASES
+from .pairing import VinFastPairing, VinFastPairingAuthError, CONTROL_ALIASES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +46,7 @@ class VinFastClimateSwitch(CoordinatorEntity[VinFastDataUpdateCoordinator], Swit
     _attr_has_entity_name = True
     _attr_translation_key = "climate"
     _attr_icon = "mdi:air-conditioner"
+    _CLIMATE_DEVICE_KEY = CONTROL_ALIASES.get("CLIMATE_CONTROL_AIR_CONDITION_ENABLE", "3416_0_5850")
 
     def __init__(
         self,
@@ -53,38 +57,42 @@ class VinFastClimateSwitch(CoordinatorEntity[VinFastDataUpdateCoordinator], Swit
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{coordinator.vin}_climate"
+        # Pairing keys are loaded on the first command, see _ensure_pairing.
+        # Options changes reload the entry, so this check can be done once.
+        pairing_keys = entry.options.get(CONF_PAIRING_KEYS) or {}
+        self._has_pairing_keys = bool(
+            pairing_keys.get("private_key_pem") and pairing_keys.get("shared_key_b64")
+        )
         self._pairing: VinFastPairing | None = None
+        self._pairing_failed: bool = False
+        self._pairing_lock = asyncio.Lock()
         self._is_on: bool = False
 
-        # Try to load pairing keys
-        self._load_pairing_keys()
-
-    def _load_pairing_keys(self) -> None:
-        """Load pairing keys from config entry options."""
-        pairing_keys = self._entry.options.get(CONF_PAIRING_KEYS)
-        if pairing_keys:
-            from homeassistant.helpers.aiohttp_client import async_get_clientsession
-            session = async_get_clientsession(self.coordinator.hass)
-            self._pairing = VinFastPairing(session)
-            if self._pairing.import_keys(pairing_keys):
+    async def _ensure_pairing(self) -> VinFastPairing | None:
+        """Load pairing keys from config entry options on first use."""
+        if self._pairing is not None:
+            return self._pairing
+        async with self._pairing_lock:
+            if self._pairing is not None or self._pairing_failed:
+                return self._pairing
+            pairing_keys = self._entry.options.get(CONF_PAIRING_KEYS)
+            pairing = VinFastPairing(async_get_clientsession(self.hass))
+            # Parsing the PEM private key is CPU-bound, so run it in the executor
+            if pairing_keys and await self.hass.async_add_executor_job(
+                pairing.import_keys, pairing_keys
+            ):
                 _LOGGER.info("Pairing keys loaded for climate control")
+                self._pairing = pairing
             else:
                 _LOGGER.warning("Failed to load pairing keys")
-                self._pairing = None
+                self._pairing_failed = True
+                self.async_write_ha_state()
+        return self._pairing
 
     @property
-    def device_info(self) -> DeviceInfo:
+    def device_info(self) -> DeviceInfo | None:
         """Return device information about this VinFast vehicle."""
-        vehicles = self.coordinator.data.get("vehicles", []) if self.coordinator.data else []
-        vehicle = vehicles[0] if vehicles else {}
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin or "unknown")},
-            name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
-            manufacturer="VinFast",
-            model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
-            sw_version=str(vehicle.get("yearOfProduct", "")),
-        )
+        return self.coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -106,8 +114,10 @@ class VinFastClimateSwitch(CoordinatorEntity[VinFastDataUpdateCoordinator], Swit
         """Return if entity is available."""
         if not self.coordinator.last_update_success:
             return False
-        # Available only if paired
-        return self._pairing is not None and self._pairing.is_paired
+        if self._pairing is not None:
+            return self._pairing.is_paired
+        # Keys not imported yet: require both stored keys and no failed import
+        return self._has_pairing_keys and not self._pairing_failed
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on climate control."""
@@ -119,40 +129,52 @@ class VinFastClimateSwitch(CoordinatorEntity[VinFastDataUpdateCoordinator], Swit
 
     async def _send_climate_command(self, value: int) -> None:
         """Send climate control command."""
-        if not self._pairing or not self._pairing.is_paired:
+        pairing = await self._ensure_pairing()
+        if pairing is None or not pairing.is_paired:
             _LOGGER.error("Cannot send command - not paired")
             return
 
-        # Re-authenticate to get fresh token
-        from homeassistant.helpers.aiohttp_client import async_get_clientsession
-        from .api import VinFastApi
-        from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-
-        session = async_get_clientsession(self.coordinator.hass)
-        api = VinFastApi(session)
+        # Reuse the coordinator's authenticated client (token and user ID)
+        api = self.coordinator.api
+        if api is None:
+            _LOGGER.error("Cannot send command - not connected")
+            return
 
         try:
-            await api.authenticate(
-                self._entry.data[CONF_EMAIL],
-                self._entry.data[CONF_PASSWORD],
-            )
-            await api.get_vehicles()
-
-            # Get device key for climate control
-            device_key = CONTROL_ALIASES.get("CLIMATE_CONTROL_AIR_CONDITION_ENABLE", "3416_0_5850")
-
-            # Send command
-            success = await self._pairing.send_command(
-                access_token=api._access_token or "",
-                message_name="CLIMATE_CONTROL_AIR_CONDITION_ENABLE",
-                device_key=device_key,
-                value=value,
-                user_id=api.user_id or "",
-                session_id=self._pairing._session_id or "",
-            )
+            if not api._access_token:
+                await api.authenticate(
+                    self._entry.data[CONF_EMAIL],
+                    self._entry.data[CONF_PASSWORD],
+                )
+
+            # Refresh (or re-authenticate) once if the token has expired
+            for attempt in range(2):
+                token = api._access_token
+                try:
+                    success = await pairing.send_command(
+                        access_token=token or "",
+                        message_name="CLIMATE_CONTROL_AIR_CONDITION_ENABLE",
+                        device_key=self._CLIMATE_DEVICE_KEY,
+                        value=value,
+                        user_id=api.user_id or "",
+                        session_id=pairing._session_id or "",
+                    )
+                except VinFastPairingAuthError:
+                    if attempt:
+                        raise
+                    # Prefer the refresh token over a full credential login
+                    if not await api.refresh_auth(token):
+                        await api.authenticate(
+                            self._entry.data[CONF_EMAIL],
+                            self._entry.data[CONF_PASSWORD],
+                        )
+                else:
+                    break
 
             if success:
                 self._is_on = value == 1
+                # The refresh below skips listeners if the data is unchanged
+                self.async_write_ha_state()
                 _LOGGER.info("Climate %s command sent successfully", "ON" if value else "OFF")
                 # Trigger coordinator refresh after a delay
                 await self.coordinator.async_request_refresh()